@@ -0,0 +1,3 @@
+from ankideck.cli import main
+
+raise SystemExit(main())
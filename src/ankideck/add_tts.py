@@ -3,18 +3,21 @@ import os
 import re
 import sys
 import time
-from gtts import gTTS
-import requests
-from tqdm import tqdm
-from pydub import AudioSegment
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python add_tts_general.py <deck_name>")
+def main(argv=None, prog=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if len(argv) < 1:
+        print(f"Usage: {prog or 'add_tts'} <deck_name>")
         sys.exit(1)
 
-    DECK_NAME = sys.argv[1].replace(" ", "_")
+    # Heavy TTS/audio dependencies are imported here so the module stays cheap to import
+    from gtts import gTTS
+    import requests
+    from tqdm import tqdm
+    from pydub import AudioSegment
+
+    DECK_NAME = argv[0].replace(" ", "_")
     FRONT_FIELD = "Front"   # فیلد جمله یا عبارت فرانسوی
     BACK_FIELD = "Back"     # فیلد توضیح و مثال‌ها
     LANG = "fr"
@@ -0,0 +1,132 @@
+"""
+cli.py
+
+Usage:
+  ankideck [--profile] [--profile-output STATS_FILE] <command> [args...]
+
+The profile flags may also be given after the subcommand.
+
+Single entry point for every ankideck operation. Each subcommand is
+resolved to a "module:function" target that is only imported when that
+subcommand runs, so lightweight commands such as fix-comma or stats do
+not pay for OCR, TTS or audio dependencies at startup.
+
+Use "ankideck <command> --help" for the options of a given command.
+"""
+import argparse
+import importlib
+import sys
+
+from ankideck import __version__
+
+# name -> (target, help)
+COMMANDS = {
+    "extract-text": ("ankideck.extract_text:main", "OCR a PDF into a text file"),
+    "fix-comma": ("ankideck.fix_comma:main", "Keep only the first comma per CSV row"),
+    "add-tts": ("ankideck.add_tts:main", "Add TTS audio to the Front and Back fields of a deck"),
+    "stats": ("ankideck.deck_stats:main", "Print card, note and media stats for a deck"),
+    "remove-no-audio": ("ankideck.modify_decks:remove_cards_without_audio",
+                        "Delete cards without audio in any field"),
+    "remove-flag": ("ankideck.modify_decks:modify_cards_contents",
+                    "Remove the 🇮🇷 emoji from card contents"),
+    "remove-sound": ("ankideck.modify_decks:remove_sound_from_field",
+                     "Remove sound tags from a given field"),
+    "remove-duplicates": ("ankideck.modify_decks:remove_duplicates",
+                          "Delete duplicate notes based on a field"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="ankideck",
+        description="Tools for creating and maintaining Anki decks.",
+    )
+    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    p.add_argument("--profile", action="store_true",
+                   help="Profile the command with cProfile and print the top entries to stderr")
+    p.add_argument("--profile-output", metavar="STATS_FILE",
+                   help="Write cProfile stats to STATS_FILE (implies --profile)")
+    sub = p.add_subparsers(dest="command", metavar="<command>")
+    sub.required = True
+    for name, (_, help_text) in COMMANDS.items():
+        # Subcommand options are parsed by the target itself
+        sub.add_parser(name, help=help_text, add_help=False)
+    return p
+
+
+def load_command(name):
+    module_name, func_name = COMMANDS[name][0].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def run_command(name, argv):
+    try:
+        return load_command(name)(argv, prog=f"ankideck {name}")
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def run_profiled(name, argv, stats_file):
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        # the lazy import of the command module is included in the profile
+        return profiler.runcall(run_command, name, argv)
+    finally:
+        if stats_file is None:
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats("cumulative").print_stats(30)
+        else:
+            profiler.dump_stats(stats_file)
+            print(f"Profile stats written to: {stats_file}", file=sys.stderr)
+
+
+def pop_profile_args(argv):
+    """Remove --profile/--profile-output given after the subcommand.
+
+    Returns (profile, profile_output, remaining_argv). Arguments after a
+    literal "--" are left untouched for the subcommand.
+    """
+    profile = False
+    profile_output = None
+    remaining = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--':
+            remaining.extend(argv[i:])
+            break
+        if arg == '--profile':
+            profile = True
+        elif arg == '--profile-output':
+            if i + 1 >= len(argv):
+                raise ValueError("argument --profile-output: expected one argument")
+            i += 1
+            profile_output = argv[i]
+        elif arg.startswith('--profile-output='):
+            profile_output = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+        i += 1
+    return profile, profile_output, remaining
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    try:
+        profile, profile_output, rest = pop_profile_args(rest)
+    except ValueError as e:
+        parser.error(str(e))
+    args.profile = args.profile or profile
+    args.profile_output = args.profile_output or profile_output
+    if args.profile or args.profile_output:
+        return run_profiled(args.command, rest, args.profile_output)
+    return run_command(args.command, rest)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
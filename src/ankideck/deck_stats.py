@@ -1,18 +1,7 @@
-import requests
 import re
 import argparse
 
-ANKI_CONNECT_URL = "http://localhost:8765"
-
-def invoke(action, **params):
-    resp = requests.post(ANKI_CONNECT_URL, json={
-        "action": action,
-        "version": 6,
-        "params": params
-    }).json()
-    if 'error' in resp and resp['error']:
-        raise Exception(f"AnkiConnect error: {resp['error']}")
-    return resp["result"]
+from ankideck.utils import invoke
 
 def get_card_ids(deck_name):
     return invoke("findCards", query=f'deck:"{deck_name}"')
@@ -33,10 +22,10 @@ def human_readable_size(size_bytes):
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} TB"
 
-def main():
-    parser = argparse.ArgumentParser(description="Get stats for an Anki deck.")
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Get stats for an Anki deck.")
     parser.add_argument("deck_name", help="Name of the Anki deck")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     deck_name = args.deck_name
     print(f"📊 Stats for deck: {deck_name}")
@@ -1,24 +1,27 @@
 # Replacing file contents with a clean, serial OCR script
 import sys
 import os
-import pytesseract
-from tqdm import tqdm
-from pdf2image import convert_from_path
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python extract_text.py <pdf_path> [output_text_path] [lang]")
+def main(argv=None, prog=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if len(argv) < 1:
+        print(f"Usage: {prog or 'extract_text'} <pdf_path> [output_text_path] [lang]")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
-    if len(sys.argv) >= 3:
-        output_text_path = sys.argv[2]
+    pdf_path = argv[0]
+    if len(argv) >= 2:
+        output_text_path = argv[1]
     else:
         name = os.path.basename(pdf_path).rsplit('.', 1)[0]
         output_text_path = f"{name}_text.txt"
 
-    lang = sys.argv[3] if len(sys.argv) >= 4 else "fra"
+    lang = argv[2] if len(argv) >= 3 else "fra"
+
+    # Heavy OCR dependencies are imported here so the module stays cheap to import
+    import pytesseract
+    from tqdm import tqdm
+    from pdf2image import convert_from_path
 
     try:
         images = convert_from_path(pdf_path)
@@ -55,8 +55,8 @@ def process_file(input_path: Path, output_path: Path) -> dict:
     return counts
 
 
-def main(argv=None):
-    p = argparse.ArgumentParser(description='Keep only first comma per row and replace later commas with semicolons.')
+def main(argv=None, prog=None):
+    p = argparse.ArgumentParser(prog=prog, description='Keep only first comma per row and replace later commas with semicolons.')
     p.add_argument('input', help='Input CSV file path')
     p.add_argument('output', nargs='?', help='Output CSV file path (optional)')
     p.add_argument('--inplace', action='store_true', help='Replace the input file in-place (backup created with .bak)')
@@ -1,16 +1,15 @@
 from ankideck.utils import find_card_ids, delete_cards, invoke, remove_duplicate_cards
-import requests
 import argparse
 import sys
 import re
 
 
 
-def remove_cards_without_audio():
-    parser = argparse.ArgumentParser(description='Modify Anki decks by deleting cards without audio in Front field.')
+def remove_cards_without_audio(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Modify Anki decks by deleting cards without audio in Front field.')
     parser.add_argument('deck_name', help='Name of the Anki deck to process')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     deck = args.deck_name.strip()
     if not deck:
         print("Error: Deck name is required.", file=sys.stderr)
@@ -37,11 +36,11 @@ def remove_cards_without_audio():
     delete_cards(card_ids)
 
 
-def modify_cards_contents():
-    parser = argparse.ArgumentParser(description='Modify Anki decks by removing 🇮🇷 emoji from card contents.')
+def modify_cards_contents(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Modify Anki decks by removing 🇮🇷 emoji from card contents.')
     parser.add_argument('deck_name', help='Name of the Anki deck to process')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     deck = args.deck_name.strip()
     if not deck:
         print("Error: Deck name is required.", file=sys.stderr)
@@ -97,12 +96,12 @@ def modify_cards_contents():
     print(f"✅ Successfully modified {modified_count} notes, removing 🇮🇷 emoji from card contents.")
 
 
-def remove_sound_from_field():
-    parser = argparse.ArgumentParser(description='Modify Anki decks by removing audio from specific fields.')
+def remove_sound_from_field(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Modify Anki decks by removing audio from specific fields.')
     parser.add_argument('deck_name', help='Name of the Anki deck to process')
     parser.add_argument('field_name', help='Name of the field to remove audio from')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     deck = args.deck_name.strip()
     field_name = args.field_name.strip()
     
@@ -167,12 +166,12 @@ def remove_sound_from_field():
     print(f"✅ Successfully modified {modified_count} notes, removing sound tags from '{field_name}' field.")
 
 
-def remove_duplicates():
-    parser = argparse.ArgumentParser(description='Remove duplicate cards from a deck based on field content.')
+def remove_duplicates(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Remove duplicate cards from a deck based on field content.')
     parser.add_argument('deck_name', help='Name of the Anki deck to process')
     parser.add_argument('--field', default='Front', help='Name of the field to check for duplicates (default: Front)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     deck = args.deck_name.strip()
     field_name = args.field.strip()
     
@@ -187,15 +186,3 @@ def remove_duplicates():
         print(f"🎉 Operation completed! Removed {removed_count} duplicate cards from deck '{deck}'.")
     else:
         print("No duplicates were removed.")
-    
-
-if __name__ == "__main__":
-    try:
-        # remove_cards_without_audio()
-        # modify_cards_contents()
-        # remove_sound_from_field()
-        # python3 modify_decks.py "Edito_A2_2022" "Back"
-        remove_duplicates()
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
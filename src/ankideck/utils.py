@@ -1,8 +1,8 @@
-import requests
-
 ANKI_CONNECT_URL = "http://localhost:8765"
 
 def invoke(action, **params):
+    # requests is imported lazily to keep command startup fast
+    import requests
     response = requests.post(ANKI_CONNECT_URL, json={
         "action": action,
         "version": 6,
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ankideck import cli
+
+HEAVY_MODULES = ("requests", "gtts", "pydub", "pytesseract", "pdf2image", "tqdm")
+
+
+def test_command_modules_do_not_import_heavy_dependencies():
+    code = (
+        "import sys\n"
+        "import ankideck.cli, ankideck.fix_comma, ankideck.deck_stats, "
+        "ankideck.modify_decks, ankideck.add_tts, ankideck.extract_text\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, env=env)
+    assert out.stdout.strip() == ""
+
+
+def test_fix_comma_dispatch(tmp_path):
+    src = tmp_path / "in.csv"
+    dst = tmp_path / "out.csv"
+    src.write_text("a,b,c\nd\n", encoding="utf-8")
+
+    assert cli.main(["fix-comma", str(src), str(dst)]) == 0
+    assert dst.read_text(encoding="utf-8") == "a,b;c\nd,\n"
+
+
+def test_profile_flag_after_subcommand(tmp_path):
+    src = tmp_path / "in.csv"
+    dst = tmp_path / "out.csv"
+    stats = tmp_path / "stats.prof"
+    src.write_text("a,b,c\n", encoding="utf-8")
+
+    assert cli.main(["fix-comma", str(src), str(dst), "--profile-output", str(stats)]) == 0
+    assert dst.read_text(encoding="utf-8") == "a,b;c\n"
+    assert stats.exists()
+
+
+def test_subcommand_prog_in_usage(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["fix-comma", "--help"])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.startswith("usage: ankideck fix-comma ")
+
+
+def test_command_errors_exit_with_status_1(monkeypatch, capsys):
+    def fail(argv, prog=None):
+        raise RuntimeError("AnkiConnect error: boom")
+
+    monkeypatch.setattr(cli, "load_command", lambda name: fail)
+    assert cli.main(["stats", "Deck"]) == 1
+    assert capsys.readouterr().err == "Error: AnkiConnect error: boom\n"